@@ -18,7 +18,7 @@ HOW TO UPDATE FOR A NEW TAX YEAR:
 2. Update TAX_YEAR constant to the new year
 3. Update LAST_UPDATED with the verification date
 4. Update any changed rates in the relevant sections:
-   - INCOME_TAX_BRACKETS: Check for bracket threshold or rate changes
+   - INCOME_TAX_BRACKETS / TOP_RATE: Check for bracket threshold or rate changes
    - VAT_RATE: Verify standard VAT rate (rarely changes)
    - EFKA rates: Check for social security contribution changes
    - MAX_ANNUAL_INCOME: Review validation limit if needed
@@ -71,8 +71,9 @@ If validation fails, an exception is raised with details about the issue.
 """
 
 from dataclasses import dataclass
-from decimal import Decimal
-from typing import List, Tuple, Final
+from decimal import Decimal, InvalidOperation
+from types import MappingProxyType
+from typing import List, Mapping, Tuple, Final
 from datetime import datetime
 
 __version__ = "1.0.0"
@@ -110,9 +111,11 @@ class TaxBracket:
     """
     Immutable data structure representing a progressive income tax bracket.
     
+    Only bounded brackets are represented; the open-ended top bracket is
+    configured separately through TOP_RATE and TOP_THRESHOLD.
+    
     Attributes:
         upper_limit (Decimal): Upper income threshold for this bracket (EUR)
-                              Use Decimal('inf') for the highest bracket
         rate (Decimal): Tax rate as decimal (e.g., 0.09 for 9%)
         description (str): Human-readable description of the bracket
     
@@ -123,13 +126,6 @@ class TaxBracket:
             rate=Decimal('0.09'),
             description='€0 - €10,000: 9%'
         )
-        
-        # Top bracket: Over €40,000 at 44%
-        TaxBracket(
-            upper_limit=Decimal('inf'),
-            rate=Decimal('0.44'),
-            description='Over €40,000: 44%'
-        )
     """
     upper_limit: Decimal
     rate: Decimal
@@ -137,9 +133,14 @@ class TaxBracket:
     
     def __post_init__(self):
         """Validate bracket data on creation."""
-        # Convert inf string to actual infinity if needed
-        if isinstance(self.upper_limit, str) and self.upper_limit == 'inf':
-            object.__setattr__(self, 'upper_limit', Decimal('inf'))
+        # Accept int/float/str limits by converting them to Decimal
+        if not isinstance(self.upper_limit, Decimal):
+            try:
+                object.__setattr__(self, 'upper_limit', Decimal(str(self.upper_limit)))
+            except InvalidOperation:
+                raise ValueError(
+                    f"Upper limit must be a number (got {self.upper_limit!r})"
+                ) from None
         
         # Validate rate is between 0 and 1
         if not (Decimal('0') <= self.rate <= Decimal('1')):
@@ -148,10 +149,11 @@ class TaxBracket:
                 f"Use decimal format: 0.09 for 9%, not 9."
             )
         
-        # Validate upper_limit is positive or infinity
-        if self.upper_limit != Decimal('inf') and self.upper_limit <= 0:
+        # Validate upper_limit is a finite positive amount
+        if not self.upper_limit.is_finite() or self.upper_limit <= 0:
             raise ValueError(
-                f"Upper limit must be positive or infinity (got {self.upper_limit})"
+                f"Upper limit must be a finite positive amount (got {self.upper_limit}). "
+                f"Configure the open-ended top bracket with TOP_RATE instead."
             )
 
 
@@ -177,7 +179,11 @@ class TaxBracket:
 # - €10,000.01 to €20,000: Second bracket
 # - €20,000.01 to €30,000: Third bracket
 # - €30,000.01 to €40,000: Fourth bracket
-# - Over €40,000: Top bracket
+# - Over €40,000: Top bracket (TOP_RATE, see below)
+#
+# Only the bounded brackets are listed here. Income above the last upper
+# limit (TOP_THRESHOLD) is taxed at TOP_RATE, so no bracket needs an
+# infinite sentinel limit.
 INCOME_TAX_BRACKETS: Final[Tuple[TaxBracket, ...]] = (
     TaxBracket(
         upper_limit=Decimal('10000.00'),
@@ -199,13 +205,14 @@ INCOME_TAX_BRACKETS: Final[Tuple[TaxBracket, ...]] = (
         rate=Decimal('0.36'),
         description='€30,001 - €40,000: 36%'
     ),
-    TaxBracket(
-        upper_limit=Decimal('inf'),
-        rate=Decimal('0.44'),
-        description='Over €40,000: 44%'
-    ),
 )
 
+# Top (open-ended) income tax bracket: all income above TOP_THRESHOLD
+# TOP_THRESHOLD is derived from the last bounded bracket to keep them in sync
+TOP_THRESHOLD: Final[Decimal] = INCOME_TAX_BRACKETS[-1].upper_limit
+TOP_RATE: Final[Decimal] = Decimal('0.44')  # 44%
+TOP_BRACKET_DESCRIPTION: Final[str] = 'Over €40,000: 44%'
+
 
 # ============================================================================
 # VAT (VALUE ADDED TAX) CONFIGURATION
@@ -283,12 +290,21 @@ MAX_ANNUAL_INCOME: Final[Decimal] = Decimal('10000000')
 # PAYMENT SCHEDULE CONFIGURATION
 # ============================================================================
 
-# Valid payment frequency options for tax payment schedules
+# Number of tax payments per year for each payment frequency
 # These are the standard payment frequencies used in Greece:
 # - 'monthly': 12 payments per year (most common for high earners)
 # - 'quarterly': 4 payments per year (common for moderate earners)
 # - 'annual': 1 payment per year (less common, for low earners)
-VALID_FREQUENCIES: Final[Tuple[str, ...]] = ('monthly', 'quarterly', 'annual')
+#
+# Wrapped in a read-only mapping proxy so it cannot be modified at runtime.
+PAYMENTS_PER_YEAR: Final[Mapping[str, int]] = MappingProxyType({
+    'monthly': 12,
+    'quarterly': 4,
+    'annual': 1
+})
+
+# Valid payment frequency options for tax payment schedules
+VALID_FREQUENCIES: Final[Tuple[str, ...]] = tuple(PAYMENTS_PER_YEAR)
 
 
 # ============================================================================
@@ -301,7 +317,8 @@ def validate_configuration() -> None:
     
     This function checks:
     1. Tax brackets are in ascending order
-    2. Tax brackets have no gaps (each starts where previous ended)
+    2. Tax brackets have no gaps (each starts where previous ended, and
+       the top bracket starts at the last upper limit)
     3. Tax rates are in valid range (0-1)
     4. EFKA rates sum correctly
     5. All required constants are defined
@@ -323,22 +340,27 @@ def validate_configuration() -> None:
                 f"got {type(bracket).__name__}"
             )
         
-        # Check ascending order (skip infinity check)
-        if bracket.upper_limit != Decimal('inf'):
-            if bracket.upper_limit <= previous_limit:
-                raise ValueError(
-                    f"Tax bracket {i} upper limit ({bracket.upper_limit}) must be "
-                    f"greater than previous bracket ({previous_limit})"
-                )
-            previous_limit = bracket.upper_limit
+        # Check ascending order
+        if bracket.upper_limit <= previous_limit:
+            raise ValueError(
+                f"Tax bracket {i} upper limit ({bracket.upper_limit}) must be "
+                f"greater than previous bracket ({previous_limit})"
+            )
+        previous_limit = bracket.upper_limit
         
         # Rate validation is already done in TaxBracket.__post_init__
     
-    # Verify last bracket has infinity upper limit
-    if INCOME_TAX_BRACKETS[-1].upper_limit != Decimal('inf'):
+    # Verify the top bracket starts where the bounded brackets end
+    if TOP_THRESHOLD != previous_limit:
+        raise ValueError(
+            f"TOP_THRESHOLD ({TOP_THRESHOLD}) must equal the last bracket "
+            f"upper limit ({previous_limit})"
+        )
+    
+    if not (Decimal('0') <= TOP_RATE <= Decimal('1')):
         raise ValueError(
-            "Last tax bracket must have infinite upper limit "
-            "(use Decimal('inf'))"
+            f"TOP_RATE must be between 0 and 1 (got {TOP_RATE}). "
+            f"Use decimal format: 0.44 for 44%, not 44."
         )
     
     # Validate VAT rate
@@ -384,6 +406,17 @@ def validate_configuration() -> None:
                 f"VALID_FREQUENCIES must contain strings, got {type(freq).__name__}"
             )
     
+    # Validate PAYMENTS_PER_YEAR
+    for freq, payments in PAYMENTS_PER_YEAR.items():
+        if freq != freq.lower():
+            raise ValueError(
+                f"PAYMENTS_PER_YEAR keys must be lowercase (got '{freq}')"
+            )
+        if not isinstance(payments, int) or payments <= 0:
+            raise ValueError(
+                f"PAYMENTS_PER_YEAR['{freq}'] must be a positive integer (got {payments!r})"
+            )
+    
     # Validate TAX_YEAR
     current_year = datetime.now().year
     if not (2020 <= TAX_YEAR <= current_year + 5):
@@ -436,6 +469,7 @@ def print_config_summary() -> str:
     
     for bracket in INCOME_TAX_BRACKETS:
         lines.append(f"  {bracket.description}")
+    lines.append(f"  {TOP_BRACKET_DESCRIPTION}")
     
     lines.extend([
         "",
@@ -14,14 +14,97 @@ All models use Python's Decimal type for financial precision and include
 serialization methods for JSON/file output.
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from decimal import Decimal
-from typing import List, Dict, Union, Any, Optional
+from typing import List, Dict, Tuple, Union, Any, Optional, ClassVar, FrozenSet, Iterator
 from datetime import datetime
 
 __version__ = "1.0.0"
 
 
+# ============================================================================
+# RESULT MODEL SUPPORT
+# ============================================================================
+
+# Result models are created in bulk by batch runs; on Python 3.10+ they are
+# slotted, which drops the per-instance __dict__ and speeds up attribute access.
+_RESULT_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+# Per-class (names in order, names as a frozenset) for LegacyItemAccess, filled lazily
+_ITEM_KEYS: Dict[type, Tuple[Tuple[str, ...], FrozenSet[str]]] = {}
+
+
+def _item_keys(cls: type) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """Return the dict-style keys of a result model class, computing them on first use."""
+    keys = _ITEM_KEYS.get(cls)
+    if keys is None:
+        names = tuple(f.name for f in fields(cls)) + tuple(
+            name for name, value in vars(cls).items() if isinstance(value, property)
+        )
+        keys = _ITEM_KEYS[cls] = (names, frozenset(names))
+    return keys
+
+
+class LegacyItemAccess:
+    """
+    Read-only dict-style access to the fields of a result model.
+    
+    The calculator functions used to return plain dictionaries. This mixin
+    keeps `result['total_tax']`, `'total_tax' in result`, `result.get(...)`
+    and iteration over the keys working for callers that have not yet
+    migrated to attribute access. Use to_dict() where a real dictionary is
+    needed.
+    
+    Keys are the dataclass fields plus any read-only properties the model
+    defines (e.g. PaymentSchedule.schedule). Subclasses can map old
+    dictionary keys to renamed attributes through _LEGACY_KEYS.
+    
+    Only models that replaced a former dict return value use this mixin;
+    TaxSummary and TaxBatchResult were introduced as dataclasses and are
+    attribute-only.
+    """
+    __slots__ = ()
+    
+    _LEGACY_KEYS: ClassVar[Dict[str, str]] = {}
+    
+    @classmethod
+    def _item_names(cls) -> Tuple[str, ...]:
+        """Dataclass field names followed by the model's read-only property names."""
+        return _item_keys(cls)[0]
+    
+    def __getitem__(self, key: str) -> Any:
+        """Return the field or property named by key (or by its legacy alias)."""
+        # Inlined fast path of _item_keys(): one dict lookup on the common hit
+        names = _ITEM_KEYS.get(type(self)) or _item_keys(type(self))
+        if key in names[1]:
+            return getattr(self, key)
+        if key in self._LEGACY_KEYS:
+            return getattr(self, self._LEGACY_KEYS[key])
+        raise KeyError(key)
+    
+    def __contains__(self, key: object) -> bool:
+        """Check whether key is a field, property or legacy alias."""
+        names = _ITEM_KEYS.get(type(self)) or _item_keys(type(self))
+        return key in names[1] or key in self._LEGACY_KEYS
+    
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the field and property names, like dict keys."""
+        return iter(self._item_names())
+    
+    def keys(self) -> List[str]:
+        """Field and property names, like dict.keys()."""
+        return list(self)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return result[key], or default if key is not a field, property or alias."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
 # ============================================================================
 # INPUT DATA MODELS
 # ============================================================================
@@ -119,8 +202,8 @@ class TaxInput:
 # TAX CALCULATION RESULT MODELS
 # ============================================================================
 
-@dataclass(frozen=True)
-class BracketBreakdown:
+@dataclass(frozen=True, **_RESULT_SLOTS)
+class BracketBreakdown(LegacyItemAccess):
     """
     Detailed breakdown of tax calculation for a single income tax bracket.
     
@@ -183,8 +266,8 @@ class BracketBreakdown:
         return f"Bracket {range_str} @ {self.rate:.0f}%: €{self.tax_amount:,.2f}"
 
 
-@dataclass(frozen=True)
-class IncomeTaxBreakdown:
+@dataclass(frozen=True, **_RESULT_SLOTS)
+class IncomeTaxBreakdown(LegacyItemAccess):
     """
     Complete income tax calculation results with bracket-by-bracket breakdown.
     
@@ -234,8 +317,8 @@ class IncomeTaxBreakdown:
         )
 
 
-@dataclass(frozen=True)
-class VATCalculation:
+@dataclass(frozen=True, **_RESULT_SLOTS)
+class VATCalculation(LegacyItemAccess):
     """
     VAT (Value Added Tax) calculation results.
     
@@ -274,8 +357,8 @@ class VATCalculation:
         return f"VAT ({self.rate:.0f}%): €{self.vat_amount:,.2f}"
 
 
-@dataclass(frozen=True)
-class SocialSecurityCalculation:
+@dataclass(frozen=True, **_RESULT_SLOTS)
+class SocialSecurityCalculation(LegacyItemAccess):
     """
     EFKA social security contribution calculation results.
     
@@ -325,8 +408,8 @@ class SocialSecurityCalculation:
         return f"EFKA ({self.rate:.0f}%): €{self.total_contribution:,.2f}"
 
 
-@dataclass(frozen=True)
-class TaxCalculationResult:
+@dataclass(frozen=True, **_RESULT_SLOTS)
+class TaxCalculationResult(LegacyItemAccess):
     """
     Comprehensive tax calculation results for Greek freelancers.
     
@@ -421,12 +504,150 @@ class TaxCalculationResult:
         )
 
 
+@dataclass(frozen=True, **_RESULT_SLOTS)
+class TaxSummary:
+    """
+    Flat tax calculation totals for a single taxpayer.
+    
+    Lightweight counterpart of TaxCalculationResult for callers that only
+    need the totals: every attribute is a plain Decimal, with no nested
+    income tax, VAT or EFKA objects and no bracket breakdown.
+    
+    Attributes:
+        gross_income (Decimal): Total gross income (excluding VAT)
+        deductible_expenses (Decimal): Total deductible business expenses
+        taxable_income (Decimal): Income after deducting expenses
+        income_tax (Decimal): Progressive income tax
+        social_security (Decimal): Total EFKA contribution
+        vat (Decimal): VAT to be collected from clients
+        total_taxes (Decimal): Income tax plus social security
+        total_obligations (Decimal): Total including VAT
+        net_income (Decimal): Income after taxes and contributions
+        effective_total_rate (Decimal): Total tax burden as percentage
+    
+    Examples:
+        >>> summary = TaxSummary(
+        ...     gross_income=Decimal('50000.00'),
+        ...     deductible_expenses=Decimal('10000.00'),
+        ...     taxable_income=Decimal('40000.00'),
+        ...     income_tax=Decimal('9500.00'),
+        ...     social_security=Decimal('10000.00'),
+        ...     vat=Decimal('12000.00'),
+        ...     total_taxes=Decimal('19500.00'),
+        ...     total_obligations=Decimal('31500.00'),
+        ...     net_income=Decimal('30500.00'),
+        ...     effective_total_rate=Decimal('39.00')
+        ... )
+    """
+    gross_income: Decimal
+    deductible_expenses: Decimal
+    taxable_income: Decimal
+    income_tax: Decimal
+    social_security: Decimal
+    vat: Decimal
+    total_taxes: Decimal
+    total_obligations: Decimal
+    net_income: Decimal
+    effective_total_rate: Decimal
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {name: str(getattr(self, name)) for name in self.__dataclass_fields__}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TaxSummary':
+        """Create instance from dictionary."""
+        return cls(**{name: Decimal(str(data[name])) for name in cls.__dataclass_fields__})
+    
+    def __str__(self) -> str:
+        """Human-readable string representation."""
+        return (
+            f"Tax Summary:\n"
+            f"  Gross Income: €{self.gross_income:,.2f}\n"
+            f"  Taxable Income: €{self.taxable_income:,.2f}\n"
+            f"  Total Taxes: €{self.total_taxes:,.2f}\n"
+            f"  Net Income: €{self.net_income:,.2f}\n"
+            f"  Effective Rate: {self.effective_total_rate:.2f}%"
+        )
+
+
+@dataclass(frozen=True, **_RESULT_SLOTS)
+class TaxBatchResult:
+    """
+    Tax calculation results for many taxpayers, stored column-wise.
+    
+    Each attribute is a list with one entry per taxpayer, in input order
+    (struct-of-arrays), so a whole column can be summed or sliced without
+    walking a list of per-taxpayer result objects. Only totals are kept;
+    bracket breakdowns and EFKA sub-components are not included.
+    
+    Attributes:
+        taxable_income (List[Decimal]): Income after deducting expenses
+        income_tax (List[Decimal]): Progressive income tax
+        social_security (List[Decimal]): Total EFKA contribution
+        vat (List[Decimal]): VAT to be collected from clients
+        total_taxes (List[Decimal]): Income tax plus social security
+        total_obligations (List[Decimal]): Total including VAT
+        net_income (List[Decimal]): Income after taxes and contributions
+        effective_total_rate (List[Decimal]): Total tax burden as percentage
+    
+    Examples:
+        >>> batch = TaxBatchResult(
+        ...     taxable_income=[Decimal('15000.00'), Decimal('30000.00')],
+        ...     income_tax=[Decimal('2000.00'), Decimal('5900.00')],
+        ...     social_security=[Decimal('3000.00'), Decimal('7000.00')],
+        ...     vat=[Decimal('3600.00'), Decimal('8400.00')],
+        ...     total_taxes=[Decimal('5000.00'), Decimal('12900.00')],
+        ...     total_obligations=[Decimal('8600.00'), Decimal('21300.00')],
+        ...     net_income=[Decimal('10000.00'), Decimal('22100.00')],
+        ...     effective_total_rate=[Decimal('33.33'), Decimal('36.86')]
+        ... )
+        >>> sum(batch.total_taxes)
+        Decimal('17900.00')
+    """
+    taxable_income: List[Decimal] = field(default_factory=list)
+    income_tax: List[Decimal] = field(default_factory=list)
+    social_security: List[Decimal] = field(default_factory=list)
+    vat: List[Decimal] = field(default_factory=list)
+    total_taxes: List[Decimal] = field(default_factory=list)
+    total_obligations: List[Decimal] = field(default_factory=list)
+    net_income: List[Decimal] = field(default_factory=list)
+    effective_total_rate: List[Decimal] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        """Number of taxpayers in the batch."""
+        return len(self.total_taxes)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            name: [str(value) for value in getattr(self, name)]
+            for name in self.__dataclass_fields__
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TaxBatchResult':
+        """Create instance from dictionary."""
+        return cls(**{
+            name: [Decimal(str(value)) for value in data.get(name, [])]
+            for name in cls.__dataclass_fields__
+        })
+    
+    def __str__(self) -> str:
+        """Human-readable string representation."""
+        return (
+            f"Tax Batch Result ({len(self)} taxpayers):\n"
+            f"  Total Taxes: €{sum(self.total_taxes, Decimal('0')):,.2f}\n"
+            f"  Total Net Income: €{sum(self.net_income, Decimal('0')):,.2f}"
+        )
+
+
 # ============================================================================
 # PAYMENT SCHEDULE MODELS
 # ============================================================================
 
-@dataclass(frozen=True)
-class PaymentInstallment:
+@dataclass(frozen=True, **_RESULT_SLOTS)
+class PaymentInstallment(LegacyItemAccess):
     """
     Single payment installment in a payment schedule.
     
@@ -463,20 +684,26 @@ class PaymentInstallment:
         return f"Payment #{self.period_number}: €{self.payment_amount:,.2f}"
 
 
-@dataclass(frozen=True)
-class PaymentSchedule:
+@dataclass(frozen=True, **_RESULT_SLOTS)
+class PaymentSchedule(LegacyItemAccess):
     """
     Complete payment schedule for tax payments.
     
     This immutable dataclass represents how annual tax obligations are broken down
     into installments based on payment frequency (monthly, quarterly, annual).
     
+    Installments are stored as two parallel tuples (period numbers and amounts)
+    rather than one object per installment; the `schedule` property builds the
+    list of PaymentInstallment objects on demand for callers that want them.
+    
     Attributes:
         annual_total (Decimal): Total annual tax amount
         frequency (str): Payment frequency ('monthly', 'quarterly', 'annual')
         number_of_installments (int): Number of payment installments
         installment_amount (Decimal): Amount per installment
-        schedule (List[PaymentInstallment]): List of individual installment details
+        period_numbers (Tuple[int, ...]): Payment number of each installment (1, 2, 3, ...)
+        payment_amounts (Tuple[Decimal, ...]): Amount of each installment,
+                                               aligned with period_numbers
     
     Examples:
         >>> # Monthly payment schedule for €12,000 annual tax
@@ -485,14 +712,31 @@ class PaymentSchedule:
         ...     frequency='monthly',
         ...     number_of_installments=12,
         ...     installment_amount=Decimal('1000.00'),
-        ...     schedule=[PaymentInstallment(1, Decimal('1000.00')), ...]
+        ...     period_numbers=tuple(range(1, 13)),
+        ...     payment_amounts=(Decimal('1000.00'),) * 12
         ... )
+        >>> schedule.schedule[0]
+        PaymentInstallment(period_number=1, payment_amount=Decimal('1000.00'))
     """
     annual_total: Decimal
     frequency: str
     number_of_installments: int
     installment_amount: Decimal
-    schedule: List[PaymentInstallment] = field(default_factory=list)
+    period_numbers: Tuple[int, ...] = ()
+    payment_amounts: Tuple[Decimal, ...] = ()
+    
+    _LEGACY_KEYS: ClassVar[Dict[str, str]] = {
+        'number_of_payments': 'number_of_installments',
+        'payment_amount': 'installment_amount'
+    }
+    
+    @property
+    def schedule(self) -> List[PaymentInstallment]:
+        """List of individual installment details, built from the parallel tuples."""
+        return [
+            PaymentInstallment(period_number=period, payment_amount=amount)
+            for period, amount in zip(self.period_numbers, self.payment_amounts)
+        ]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -512,15 +756,17 @@ class PaymentSchedule:
         # Support both old and new key names
         num_installments = data.get('number_of_installments', data.get('number_of_payments', 0))
         installment_amt = data.get('installment_amount', data.get('payment_amount', '0'))
+        installments = [
+            PaymentInstallment.from_dict(inst) for inst in data.get('schedule', [])
+        ]
         
         return cls(
             annual_total=Decimal(str(data['annual_total'])),
             frequency=data['frequency'],
             number_of_installments=int(num_installments),
             installment_amount=Decimal(str(installment_amt)),
-            schedule=[
-                PaymentInstallment.from_dict(inst) for inst in data.get('schedule', [])
-            ]
+            period_numbers=tuple(inst.period_number for inst in installments),
+            payment_amounts=tuple(inst.payment_amount for inst in installments)
         )
     
     def __str__(self) -> str:
@@ -583,16 +829,13 @@ if __name__ == "__main__":
     # Test PaymentSchedule
     print("\n3. Testing PaymentSchedule:")
     print("-" * 70)
-    installments = [
-        PaymentInstallment(i, Decimal('1000.00'))
-        for i in range(1, 13)
-    ]
     schedule = PaymentSchedule(
         annual_total=Decimal('12000.00'),
         frequency='monthly',
         number_of_installments=12,
         installment_amount=Decimal('1000.00'),
-        schedule=installments
+        period_numbers=tuple(range(1, 13)),
+        payment_amounts=(Decimal('1000.00'),) * 12
     )
     print(f"✓ Created: {schedule}")
     
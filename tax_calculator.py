@@ -101,18 +101,23 @@ For official information, consult:
 - Taxisnet (Tax Portal): https://www.gsis.gr
 """
 
+import functools
 import logging
+from bisect import bisect_left
 from decimal import Decimal, ROUND_HALF_UP, getcontext
-from typing import Dict, List, Tuple, Union
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
 
 # Import configuration from centralized config module
 from config import (
     INCOME_TAX_BRACKETS,
+    TOP_RATE,
+    TOP_THRESHOLD,
     VAT_RATE,
     EFKA_MAIN_RATE,
     EFKA_ADDITIONAL_RATE,
     EFKA_TOTAL_RATE,
     VALID_FREQUENCIES,
+    PAYMENTS_PER_YEAR,
     TAX_YEAR,
     LAST_UPDATED
 )
@@ -124,7 +129,8 @@ from models import (
     VATCalculation,
     SocialSecurityCalculation,
     TaxCalculationResult,
-    PaymentInstallment,
+    TaxSummary,
+    TaxBatchResult,
     PaymentSchedule
 )
 
@@ -145,17 +151,154 @@ getcontext().rounding = ROUND_HALF_UP
 # and makes it easier to update rates when tax laws change.
 #
 # See config.py for:
-# - INCOME_TAX_BRACKETS: Progressive tax bracket thresholds and rates
+# - INCOME_TAX_BRACKETS, TOP_RATE, TOP_THRESHOLD: Progressive tax brackets
 # - VAT_RATE: Value Added Tax rate (24%)
 # - EFKA rates: Social security contribution rates
-# - VALID_FREQUENCIES: Payment schedule options
+# - VALID_FREQUENCIES and PAYMENTS_PER_YEAR: Payment schedule options
 # - TAX_YEAR and LAST_UPDATED: Version metadata
 
 
+# ============================================================================
+# ROUNDING CONSTANTS
+# ============================================================================
+# Amounts are carried at full Decimal precision through each calculation and
+# quantized to cents exactly once, when the result object is assembled.
+_CENT = Decimal('0.01')
+_ZERO = Decimal('0')
+_ZERO_AMOUNT = Decimal('0.00')
+
+_WHOLE = Decimal('1')
+
+# Reported rates (as percentages) never change at runtime
+_VAT_RATE_PCT = (VAT_RATE * 100).quantize(_CENT, ROUND_HALF_UP)
+_EFKA_RATE_PCT = (EFKA_TOTAL_RATE * 100).quantize(_CENT, ROUND_HALF_UP)
+
+# Results for zero (or negative) gross income are the same on every call.
+# The models are frozen, so one instance of each can be shared by all callers.
+_ZERO_VAT = VATCalculation(vat_amount=_ZERO_AMOUNT, rate=_VAT_RATE_PCT)
+_ZERO_SOCIAL_SECURITY = SocialSecurityCalculation(
+    total_contribution=_ZERO_AMOUNT,
+    main_insurance=_ZERO_AMOUNT,
+    additional_contributions=_ZERO_AMOUNT,
+    rate=_EFKA_RATE_PCT
+)
+_ZERO_TOTALS: Tuple[Decimal, ...] = (_ZERO_AMOUNT,) * 8
+
+
+# ============================================================================
+# INTEGER CENT ARITHMETIC
+# ============================================================================
+# The income tax kernel works on plain integers: amounts in whole cents and
+# rates in basis points (1 bp = 0.01%). A product of the two is exact in
+# units of 1/10,000 cent, so nothing is rounded until the final result.
+_BP_PER_UNIT = 10000
+
+
+def _to_cents(amount: Decimal) -> int:
+    """Convert an EUR amount to whole cents, rounding half up."""
+    return int(amount.scaleb(2).quantize(_WHOLE, ROUND_HALF_UP))
+
+
+def _from_cents(cents: int) -> Decimal:
+    """Convert whole cents back to an EUR amount with 2 decimal places."""
+    return Decimal(cents).scaleb(-2)
+
+
+def _to_basis_points(rate: Decimal) -> int:
+    """
+    Convert a decimal rate (e.g. 0.09) to integer basis points (900).
+    
+    Raises:
+        ValueError: If the rate has more precision than 1 basis point
+    """
+    basis_points = rate.scaleb(4)
+    if basis_points != basis_points.to_integral_value():
+        raise ValueError(f"Rate {rate} cannot be represented in whole basis points")
+    return int(basis_points)
+
+
+def _div_half_up(numerator: int, denominator: int) -> int:
+    """Integer division of non-negative values, rounding half up."""
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+# ============================================================================
+# PRECOMPUTED BRACKET TABLES
+# ============================================================================
+# Lower bound, width and rate of each income tax bracket, derived once from
+# INCOME_TAX_BRACKETS at import time so bulk calculations don't have to
+# re-walk the bracket objects for every income. _BRACKET_STARTS and
+# _BRACKET_RATES also cover the open-ended top bracket (TOP_THRESHOLD at
+# TOP_RATE); _BRACKET_WIDTHS and _BRACKET_TABLE only cover the bounded ones.
+_BRACKET_STARTS: Tuple[Decimal, ...] = (_ZERO,) + tuple(
+    bracket.upper_limit for bracket in INCOME_TAX_BRACKETS
+)
+_BRACKET_WIDTHS: Tuple[Decimal, ...] = tuple(
+    bracket.upper_limit - start
+    for bracket, start in zip(INCOME_TAX_BRACKETS, _BRACKET_STARTS)
+)
+_BRACKET_RATES: Tuple[Decimal, ...] = tuple(bracket.rate for bracket in INCOME_TAX_BRACKETS) + (TOP_RATE,)
+_BRACKET_TABLE: Tuple[Tuple[Decimal, Decimal, Decimal], ...] = tuple(
+    zip(_BRACKET_STARTS, _BRACKET_WIDTHS, _BRACKET_RATES)
+)
+
+# Fixed part of each bracket's breakdown entry, already in reported form:
+# (bracket_min, bracket_max, rate as a percentage), with 'unlimited' as the
+# top bracket's maximum. Only the per-income amounts are filled in per call.
+_BRACKET_TEMPLATES: Tuple[Tuple[Decimal, Union[Decimal, str], Decimal], ...] = tuple(
+    (
+        start.quantize(_CENT, ROUND_HALF_UP),
+        (start + width).quantize(_CENT, ROUND_HALF_UP),
+        (rate * 100).quantize(_CENT, ROUND_HALF_UP)
+    )
+    for start, width, rate in _BRACKET_TABLE
+) + ((
+    TOP_THRESHOLD.quantize(_CENT, ROUND_HALF_UP),
+    'unlimited',
+    (TOP_RATE * 100).quantize(_CENT, ROUND_HALF_UP)
+),)
+
+# Integer versions of the tables for the income tax kernel: lower bounds in
+# cents, rates in basis points, and the tax owed on all income below each
+# bracket's lower bound (€0, €900, €3,100, ...) in cent x basis-point units.
+# With them, tax on any income is a single closed-form expression:
+#   tax = _CUM_TAX_UNITS[k] + (income - _BRACKET_STARTS_CENTS[k]) * _BRACKET_RATES_BP[k]
+# where k is the bracket the income falls into.
+_BRACKET_STARTS_CENTS: Tuple[int, ...] = tuple(_to_cents(start) for start in _BRACKET_STARTS)
+_BRACKET_RATES_BP: Tuple[int, ...] = tuple(_to_basis_points(rate) for rate in _BRACKET_RATES)
+_CUM_TAX_UNITS: Tuple[int, ...] = (0,) + tuple(
+    sum(
+        (_BRACKET_STARTS_CENTS[j + 1] - _BRACKET_STARTS_CENTS[j]) * _BRACKET_RATES_BP[j]
+        for j in range(i)
+    )
+    for i in range(1, len(_BRACKET_STARTS_CENTS))
+)
+
+
 # ============================================================================
 # CORE TAX CALCULATION FUNCTIONS
 # ============================================================================
 
+def _taxable_income_raw(gross_income: Decimal, deductible_expenses: Decimal) -> Decimal:
+    """Unrounded taxable income (never negative)."""
+    return max(_ZERO, gross_income - deductible_expenses)
+
+
+def _vat_raw(gross_income: Decimal) -> Decimal:
+    """Unrounded VAT amount for a positive gross income."""
+    return gross_income * VAT_RATE
+
+
+def _social_security_raw(gross_income: Decimal) -> Tuple[Decimal, Decimal]:
+    """
+    Unrounded (main, additional) EFKA contributions for a positive gross income.
+    
+    The unrounded total is main + additional, which in Decimal is exactly
+    gross_income * EFKA_TOTAL_RATE; EFKA_TOTAL_RATE itself is only reported.
+    """
+    return gross_income * EFKA_MAIN_RATE, gross_income * EFKA_ADDITIONAL_RATE
+
+
 def calculate_taxable_income(gross_income: Union[Decimal, float, int, str], 
                             deductible_expenses: Union[Decimal, float, int, str]) -> Decimal:
     """
@@ -172,83 +315,205 @@ def calculate_taxable_income(gross_income: Union[Decimal, float, int, str],
     gross_income = Decimal(str(gross_income))
     deductible_expenses = Decimal(str(deductible_expenses))
     
-    taxable = max(Decimal('0'), gross_income - deductible_expenses)
-    result = taxable.quantize(Decimal('0.01'), ROUND_HALF_UP)
+    result = _taxable_income_raw(gross_income, deductible_expenses).quantize(_CENT, ROUND_HALF_UP)
     logger.debug(f"Taxable income calculated: {result}")
     return result
 
 
-def calculate_income_tax(taxable_income: Union[Decimal, float, int, str]) -> IncomeTaxBreakdown:
+def _income_tax_kernel(taxable_cents: int) -> Tuple[int, int]:
+    """
+    Compute income tax and effective rate for a positive taxable income.
+    
+    Pure integer core of the income tax calculation; it allocates no
+    breakdown objects, does no logging and never touches Decimal. The bracket
+    is located with a binary search over the bracket lower bounds (an income
+    exactly on a limit belongs to the lower bracket), then the closed-form
+    cumulative-tax formula is applied exactly and rounded half up once.
+    
+    Args:
+        taxable_cents: Taxable income in cents (must be > 0)
+    
+    Returns:
+        Tuple[int, int]: (total_tax in cents, effective_rate in hundredths
+                         of a percent)
+    """
+    k = bisect_left(_BRACKET_STARTS_CENTS, taxable_cents) - 1
+    tax_units = _CUM_TAX_UNITS[k] + (taxable_cents - _BRACKET_STARTS_CENTS[k]) * _BRACKET_RATES_BP[k]
+    # tax / income * 100 in hundredths of a percent reduces to tax_units / taxable_cents
+    return _div_half_up(tax_units, _BP_PER_UNIT), _div_half_up(tax_units, taxable_cents)
+
+
+def _bracket_entry(index: int, amount_in_bracket: Decimal) -> BracketBreakdown:
+    """Build one rounded BracketBreakdown entry from its precomputed template."""
+    bracket_min, bracket_max, rate_pct = _BRACKET_TEMPLATES[index]
+    rate = _BRACKET_RATES[index]
+    taxable_in_bracket = amount_in_bracket.quantize(_CENT, ROUND_HALF_UP)
+    tax_in_bracket = (amount_in_bracket * rate).quantize(_CENT, ROUND_HALF_UP)
+    
+    logger.debug(f"Bracket {index+1}: amount={taxable_in_bracket}, "
+                f"rate={rate_pct}%, tax={tax_in_bracket}")
+    
+    return BracketBreakdown(
+        bracket_min=bracket_min,
+        bracket_max=bracket_max,
+        rate=rate_pct,
+        taxable_amount=taxable_in_bracket,
+        tax_amount=tax_in_bracket
+    )
+
+
+def _build_bracket_breakdown(taxable_income: Decimal) -> List[BracketBreakdown]:
+    """
+    Build the bracket-by-bracket breakdown for a positive taxable income.
+    
+    Args:
+        taxable_income: Taxable income in EUR (must be > 0)
+    
+    Returns:
+        List[BracketBreakdown]: One entry per bracket the income reaches
+    """
+    bracket_breakdown = []
+    for i, (start, width, _) in enumerate(_BRACKET_TABLE):
+        if taxable_income <= start:
+            break
+        bracket_breakdown.append(_bracket_entry(i, min(taxable_income - start, width)))
+    
+    # Open-ended top bracket
+    if taxable_income > TOP_THRESHOLD:
+        bracket_breakdown.append(_bracket_entry(len(_BRACKET_TABLE), taxable_income - TOP_THRESHOLD))
+    return bracket_breakdown
+
+
+@functools.lru_cache(maxsize=4096)
+def _income_tax_cached(taxable_cents: int,
+                       include_breakdown: bool) -> Tuple[Decimal, Decimal, Tuple[BracketBreakdown, ...]]:
+    """
+    Memoized income tax calculation keyed on taxable income in whole cents.
+    
+    Payroll-style workloads repeat the same few salary levels many times, so
+    each distinct income only goes through the bracket calculation once.
+    The result is immutable so cached entries can be shared between callers.
+    
+    Note: The brackets are fixed once this module is imported. INCOME_TAX_BRACKETS
+    and TOP_RATE are bound at import and frozen into the precomputed bracket
+    tables (_BRACKET_STARTS_CENTS, _BRACKET_RATES_BP, _CUM_TAX_UNITS,
+    _BRACKET_TEMPLATES) as well as into this cache, so clearing the cache
+    alone is not enough. Changing the brackets requires reloading config and
+    this module (importlib.reload), which also starts both caches afresh.
+    
+    Args:
+        taxable_cents: Taxable income in cents (must be > 0)
+        include_breakdown: Whether to build the per-bracket breakdown
+    
+    Returns:
+        Tuple: (total_tax, effective_rate, bracket_breakdown), amounts rounded
+               to 2 decimal places
+    """
+    total_tax_cents, effective_rate_hundredths = _income_tax_kernel(taxable_cents)
+    bracket_breakdown = tuple(_build_bracket_breakdown(_from_cents(taxable_cents))) if include_breakdown else ()
+    return (
+        _from_cents(total_tax_cents),
+        _from_cents(effective_rate_hundredths),
+        bracket_breakdown
+    )
+
+
+def calculate_income_tax(taxable_income: Union[Decimal, float, int, str],
+                         include_breakdown: bool = True) -> IncomeTaxBreakdown:
     """
     Calculate progressive income tax based on Greek tax brackets for 2024.
     
     Applies progressive taxation where each bracket is taxed at its own rate.
+    The taxable income is rounded to whole cents first, and results are
+    memoized per cent value (see _income_tax_cached).
     
     Args:
         taxable_income: Taxable income in EUR (after deductions)
+        include_breakdown: Build the per-bracket breakdown. Pass False when
+                           only the totals are needed to skip allocating it.
     
     Returns:
         IncomeTaxBreakdown: Income tax calculation with bracket-by-bracket details
+                            (empty bracket_breakdown if include_breakdown is False)
     """
     logger.debug("Calculating income tax using progressive brackets")
-    taxable_income = Decimal(str(taxable_income))
+    taxable_cents = _to_cents(Decimal(str(taxable_income)))
     
-    if taxable_income <= 0:
+    if taxable_cents <= 0:
         logger.debug("Taxable income is zero or negative - returning zero tax")
         return IncomeTaxBreakdown(
-            total_tax=Decimal('0.00'),
-            effective_rate=Decimal('0.00'),
+            total_tax=_ZERO_AMOUNT,
+            effective_rate=_ZERO_AMOUNT,
             bracket_breakdown=[]
         )
     
-    logger.debug(f"Processing {len(INCOME_TAX_BRACKETS)} tax brackets")
-    total_tax = Decimal('0')
-    bracket_breakdown = []
-    remaining_income = taxable_income
-    previous_bracket_limit = Decimal('0')
-    
-    for i, bracket in enumerate(INCOME_TAX_BRACKETS):
-        if remaining_income <= 0:
-            break
-        
-        bracket_limit = bracket.upper_limit
-        rate = bracket.rate
-        
-        if bracket_limit == Decimal('inf'):
-            taxable_in_bracket = remaining_income
-        else:
-            bracket_size = bracket_limit - previous_bracket_limit
-            taxable_in_bracket = min(remaining_income, bracket_size)
-        
-        tax_in_bracket = taxable_in_bracket * rate
-        total_tax += tax_in_bracket
-        
-        logger.debug(f"Bracket {i+1}: amount={taxable_in_bracket.quantize(Decimal('0.01'), ROUND_HALF_UP)}, "
-                    f"rate={rate*100:.2f}%, tax={tax_in_bracket.quantize(Decimal('0.01'), ROUND_HALF_UP)}")
-        
-        bracket_breakdown.append(BracketBreakdown(
-            bracket_min=previous_bracket_limit.quantize(Decimal('0.01'), ROUND_HALF_UP),
-            bracket_max='unlimited' if bracket_limit == Decimal('inf') else bracket_limit.quantize(Decimal('0.01'), ROUND_HALF_UP),
-            rate=(rate * 100).quantize(Decimal('0.01'), ROUND_HALF_UP),
-            taxable_amount=taxable_in_bracket.quantize(Decimal('0.01'), ROUND_HALF_UP),
-            tax_amount=tax_in_bracket.quantize(Decimal('0.01'), ROUND_HALF_UP)
-        ))
-        
-        remaining_income -= taxable_in_bracket
-        if bracket_limit != Decimal('inf'):
-            previous_bracket_limit = bracket_limit
-    
-    effective_rate = (total_tax / taxable_income * 100) if taxable_income > 0 else Decimal('0')
-    total_tax_rounded = total_tax.quantize(Decimal('0.01'), ROUND_HALF_UP)
-    logger.debug(f"Income tax calculation complete: total_tax={total_tax_rounded}, effective_rate={effective_rate.quantize(Decimal('0.01'), ROUND_HALF_UP)}%")
+    total_tax, effective_rate, bracket_breakdown = _income_tax_cached(taxable_cents, include_breakdown)
+    logger.debug(f"Income tax calculation complete: total_tax={total_tax}, effective_rate={effective_rate}%")
     
     return IncomeTaxBreakdown(
-        total_tax=total_tax_rounded,
-        effective_rate=effective_rate.quantize(Decimal('0.01'), ROUND_HALF_UP),
-        bracket_breakdown=bracket_breakdown
+        total_tax=total_tax,
+        effective_rate=effective_rate,
+        bracket_breakdown=list(bracket_breakdown)
     )
 
 
+def _income_tax_cents_batch(taxable_cents: Iterable[int]) -> List[int]:
+    """
+    Compute income tax in cents for many taxable incomes in cents.
+    
+    Batch form of _income_tax_kernel(): a single straight-line loop with the
+    bracket tables and bisect bound to locals, no per-income function calls,
+    no cache bookkeeping and no Decimal objects. Incomes <= 0 are taxed at 0.
+    The loop body must stay in step with _income_tax_kernel().
+    
+    Args:
+        taxable_cents: Taxable incomes in cents
+    
+    Returns:
+        List[int]: Total income tax in cents for each input, in input order
+    """
+    starts = _BRACKET_STARTS_CENTS
+    rates = _BRACKET_RATES_BP
+    cumulative = _CUM_TAX_UNITS
+    search = bisect_left
+    # _div_half_up(tax_units, unit) inlined: (2 * tax_units + unit) // (2 * unit)
+    unit = _BP_PER_UNIT
+    double_unit = 2 * _BP_PER_UNIT
+    
+    results = []
+    for cents in taxable_cents:
+        if cents <= 0:
+            results.append(0)
+            continue
+        k = search(starts, cents) - 1
+        tax_units = cumulative[k] + (cents - starts[k]) * rates[k]
+        results.append((2 * tax_units + unit) // double_unit)
+    return results
+
+
+def calculate_income_tax_batch(taxable_incomes: Iterable[Union[Decimal, float, int, str]]) -> List[Decimal]:
+    """
+    Calculate progressive income tax for many taxable incomes in one call.
+    
+    Bulk counterpart of calculate_income_tax() for payroll-style workloads.
+    Incomes are rounded to whole cents and taxed by a tight integer loop
+    (_income_tax_cents_batch) instead of going through the per-income cache.
+    Only the total tax is produced; no bracket breakdown is built.
+    
+    Args:
+        taxable_incomes: Taxable incomes in EUR (after deductions)
+    
+    Returns:
+        List[Decimal]: Total income tax for each input, in input order,
+                       rounded to 2 decimal places (0.00 for incomes <= 0)
+    """
+    taxable_cents = [_to_cents(Decimal(str(taxable_income))) for taxable_income in taxable_incomes]
+    results = [_from_cents(tax_cents) for tax_cents in _income_tax_cents_batch(taxable_cents)]
+    
+    logger.debug(f"Batch income tax calculated for {len(results)} incomes")
+    return results
+
+
 def calculate_vat(gross_income: Union[Decimal, float, int, str]) -> VATCalculation:
     """
     Calculate Value Added Tax (VAT) for Greek freelancers.
@@ -264,19 +529,12 @@ def calculate_vat(gross_income: Union[Decimal, float, int, str]) -> VATCalculati
     
     if gross_income <= 0:
         logger.debug("Gross income is zero or negative - returning zero VAT")
-        return VATCalculation(
-            vat_amount=Decimal('0.00'),
-            rate=(VAT_RATE * 100).quantize(Decimal('0.01'), ROUND_HALF_UP)
-        )
+        return _ZERO_VAT
     
-    vat_amount = gross_income * VAT_RATE
-    vat_rounded = vat_amount.quantize(Decimal('0.01'), ROUND_HALF_UP)
-    logger.debug(f"VAT calculated: {vat_rounded}")
+    vat_amount = _vat_raw(gross_income).quantize(_CENT, ROUND_HALF_UP)
+    logger.debug(f"VAT calculated: {vat_amount}")
     
-    return VATCalculation(
-        vat_amount=vat_rounded,
-        rate=(VAT_RATE * 100).quantize(Decimal('0.01'), ROUND_HALF_UP)
-    )
+    return VATCalculation(vat_amount=vat_amount, rate=_VAT_RATE_PCT)
 
 
 def calculate_social_security(gross_income: Union[Decimal, float, int, str]) -> SocialSecurityCalculation:
@@ -296,32 +554,27 @@ def calculate_social_security(gross_income: Union[Decimal, float, int, str]) ->
     
     if gross_income <= 0:
         logger.debug("Gross income is zero or negative - returning zero EFKA")
-        return SocialSecurityCalculation(
-            total_contribution=Decimal('0.00'),
-            main_insurance=Decimal('0.00'),
-            additional_contributions=Decimal('0.00'),
-            rate=(EFKA_TOTAL_RATE * 100).quantize(Decimal('0.01'), ROUND_HALF_UP)
-        )
-    
-    main_insurance = gross_income * EFKA_MAIN_RATE
-    additional_contributions = gross_income * EFKA_ADDITIONAL_RATE
-    total_contribution = gross_income * EFKA_TOTAL_RATE
+        return _ZERO_SOCIAL_SECURITY
     
-    total_rounded = total_contribution.quantize(Decimal('0.01'), ROUND_HALF_UP)
-    logger.debug(f"EFKA calculated: main={main_insurance.quantize(Decimal('0.01'), ROUND_HALF_UP)}, "
-                f"additional={additional_contributions.quantize(Decimal('0.01'), ROUND_HALF_UP)}, "
-                f"total={total_rounded}")
+    main_raw, additional_raw = _social_security_raw(gross_income)
+    total_contribution = (main_raw + additional_raw).quantize(_CENT, ROUND_HALF_UP)
+    main_insurance = main_raw.quantize(_CENT, ROUND_HALF_UP)
+    additional_contributions = additional_raw.quantize(_CENT, ROUND_HALF_UP)
+    logger.debug(f"EFKA calculated: main={main_insurance}, "
+                f"additional={additional_contributions}, "
+                f"total={total_contribution}")
     
     return SocialSecurityCalculation(
-        total_contribution=total_rounded,
-        main_insurance=main_insurance.quantize(Decimal('0.01'), ROUND_HALF_UP),
-        additional_contributions=additional_contributions.quantize(Decimal('0.01'), ROUND_HALF_UP),
-        rate=(EFKA_TOTAL_RATE * 100).quantize(Decimal('0.01'), ROUND_HALF_UP)
+        total_contribution=total_contribution,
+        main_insurance=main_insurance,
+        additional_contributions=additional_contributions,
+        rate=_EFKA_RATE_PCT
     )
 
 
 def calculate_all_taxes(gross_income: Union[Decimal, float, int, str], 
-                       deductible_expenses: Union[Decimal, float, int, str]) -> TaxCalculationResult:
+                       deductible_expenses: Union[Decimal, float, int, str],
+                       detailed: bool = True) -> TaxCalculationResult:
     """
     Calculate all tax components for Greek freelancers.
     
@@ -329,9 +582,15 @@ def calculate_all_taxes(gross_income: Union[Decimal, float, int, str],
     and total tax burden. Note: Income tax is on taxable income, but EFKA and VAT
     are calculated on gross income.
     
+    Each component is computed at full precision and rounded once. The totals
+    are sums of the already-rounded components, so they are exact to the cent
+    and always agree with the parts shown to the user.
+    
     Args:
         gross_income: Total gross income in EUR (excluding VAT)
         deductible_expenses: Total deductible business expenses in EUR
+        detailed: Include the income tax bracket breakdown. Pass False when
+                  only the totals are needed (e.g. bulk runs) to skip building it.
     
     Returns:
         TaxCalculationResult: Comprehensive tax calculation with all components
@@ -341,56 +600,228 @@ def calculate_all_taxes(gross_income: Union[Decimal, float, int, str],
     
     gross_income = Decimal(str(gross_income))
     deductible_expenses = Decimal(str(deductible_expenses))
+    gross_rounded = gross_income.quantize(_CENT, ROUND_HALF_UP)
+    expenses_rounded = deductible_expenses.quantize(_CENT, ROUND_HALF_UP)
     
     if gross_income <= 0:
         logger.warning(f"Zero or negative gross income provided")
         logger.info("Returning zero tax calculation result")
         return TaxCalculationResult(
-            gross_income=gross_income.quantize(Decimal('0.01'), ROUND_HALF_UP),
-            deductible_expenses=deductible_expenses.quantize(Decimal('0.01'), ROUND_HALF_UP),
-            taxable_income=Decimal('0.00'),
-            income_tax=calculate_income_tax(0),
-            vat=calculate_vat(0),
-            social_security=calculate_social_security(0),
-            total_taxes=Decimal('0.00'),
-            total_obligations=Decimal('0.00'),
-            net_income=Decimal('0.00'),
-            effective_total_rate=Decimal('0.00')
+            gross_income=gross_rounded,
+            deductible_expenses=expenses_rounded,
+            taxable_income=_ZERO_AMOUNT,
+            # bracket_breakdown is a list, so the income tax part is not shared
+            income_tax=IncomeTaxBreakdown(
+                total_tax=_ZERO_AMOUNT,
+                effective_rate=_ZERO_AMOUNT,
+                bracket_breakdown=[]
+            ),
+            vat=_ZERO_VAT,
+            social_security=_ZERO_SOCIAL_SECURITY,
+            total_taxes=_ZERO_AMOUNT,
+            total_obligations=_ZERO_AMOUNT,
+            net_income=_ZERO_AMOUNT,
+            effective_total_rate=_ZERO_AMOUNT
         )
     
     logger.debug("Calculating individual tax components")
-    taxable_income = calculate_taxable_income(gross_income, deductible_expenses)
-    income_tax = calculate_income_tax(taxable_income)
-    vat = calculate_vat(gross_income)
-    social_security = calculate_social_security(gross_income)
+    if deductible_expenses == 0:
+        # Common case (no expenses): taxable income is the gross income itself
+        taxable_income = gross_rounded
+    else:
+        taxable_income = _taxable_income_raw(gross_income, deductible_expenses).quantize(_CENT, ROUND_HALF_UP)
+    income_tax = calculate_income_tax(taxable_income, include_breakdown=detailed)
+    vat = VATCalculation(
+        vat_amount=(gross_income * VAT_RATE).quantize(_CENT, ROUND_HALF_UP),
+        rate=_VAT_RATE_PCT
+    )
+    main_raw, additional_raw = _social_security_raw(gross_income)
+    social_security = SocialSecurityCalculation(
+        total_contribution=(main_raw + additional_raw).quantize(_CENT, ROUND_HALF_UP),
+        main_insurance=main_raw.quantize(_CENT, ROUND_HALF_UP),
+        additional_contributions=additional_raw.quantize(_CENT, ROUND_HALF_UP),
+        rate=_EFKA_RATE_PCT
+    )
     
     logger.debug("Calculating totals and net income")
+    # Sums of cent-rounded amounts are already exact to the cent
     total_taxes = income_tax.total_tax + social_security.total_contribution
     total_obligations = total_taxes + vat.vat_amount
-    net_income = gross_income - total_taxes
-    effective_total_rate = (total_taxes / gross_income * 100) if gross_income > 0 else Decimal('0')
+    net_income = gross_rounded - total_taxes
+    effective_total_rate = (total_taxes / gross_income * 100).quantize(_CENT, ROUND_HALF_UP)
     
     # Log summary at INFO level without sensitive amounts
     logger.info("Tax calculation completed successfully")
     # Log detailed amounts at DEBUG level only
-    logger.debug(f"Calculation summary: total_taxes={total_taxes.quantize(Decimal('0.01'), ROUND_HALF_UP)}, "
-                f"net_income={net_income.quantize(Decimal('0.01'), ROUND_HALF_UP)}, "
-                f"effective_rate={effective_total_rate.quantize(Decimal('0.01'), ROUND_HALF_UP)}%")
+    logger.debug(f"Calculation summary: total_taxes={total_taxes}, "
+                f"net_income={net_income}, "
+                f"effective_rate={effective_total_rate}%")
     
     return TaxCalculationResult(
-        gross_income=gross_income.quantize(Decimal('0.01'), ROUND_HALF_UP),
-        deductible_expenses=deductible_expenses.quantize(Decimal('0.01'), ROUND_HALF_UP),
+        gross_income=gross_rounded,
+        deductible_expenses=expenses_rounded,
         taxable_income=taxable_income,
         income_tax=income_tax,
         vat=vat,
         social_security=social_security,
-        total_taxes=total_taxes.quantize(Decimal('0.01'), ROUND_HALF_UP),
-        total_obligations=total_obligations.quantize(Decimal('0.01'), ROUND_HALF_UP),
-        net_income=net_income.quantize(Decimal('0.01'), ROUND_HALF_UP),
-        effective_total_rate=effective_total_rate.quantize(Decimal('0.01'), ROUND_HALF_UP)
+        total_taxes=total_taxes,
+        total_obligations=total_obligations,
+        net_income=net_income,
+        effective_total_rate=effective_total_rate
     )
 
 
+def _all_taxes_kernel(gross_income: Decimal, deductible_expenses: Decimal) -> Tuple[Decimal, ...]:
+    """
+    Compute the rounded tax totals for a single taxpayer without building models.
+    
+    Row kernel of calculate_all_taxes_fast() and calculate_all_taxes_batch();
+    produces the same totals as calculate_all_taxes() but skips logging, the
+    bracket breakdown, and all intermediate result objects.
+    
+    Args:
+        gross_income: Total gross income in EUR (excluding VAT)
+        deductible_expenses: Total deductible business expenses in EUR
+    
+    Returns:
+        Tuple[Decimal, ...]: (taxable_income, income_tax, social_security, vat,
+                              total_taxes, total_obligations, net_income,
+                              effective_total_rate), in TaxBatchResult field order
+    """
+    if gross_income <= 0:
+        return _ZERO_TOTALS
+    
+    if deductible_expenses == 0:
+        taxable_cents = _to_cents(gross_income)
+    else:
+        taxable_cents = _to_cents(_taxable_income_raw(gross_income, deductible_expenses))
+    income_tax = _income_tax_cached(taxable_cents, False)[0] if taxable_cents > 0 else _ZERO_AMOUNT
+    main_raw, additional_raw = _social_security_raw(gross_income)
+    social_security = (main_raw + additional_raw).quantize(_CENT, ROUND_HALF_UP)
+    vat = (gross_income * VAT_RATE).quantize(_CENT, ROUND_HALF_UP)
+    
+    total_taxes = income_tax + social_security
+    return (
+        _from_cents(taxable_cents),
+        income_tax,
+        social_security,
+        vat,
+        total_taxes,
+        total_taxes + vat,
+        gross_income.quantize(_CENT, ROUND_HALF_UP) - total_taxes,
+        (total_taxes / gross_income * 100).quantize(_CENT, ROUND_HALF_UP)
+    )
+
+
+@functools.lru_cache(maxsize=8192)
+def _calc_all_taxes_cached(gross_cents: int, exp_cents: int) -> Tuple[Decimal, ...]:
+    """
+    Memoized _all_taxes_kernel() keyed on gross income and expenses in whole cents.
+    
+    Used by calculate_all_taxes_fast(), whose callers typically look up the
+    same few (gross, expenses) pairs (salary tiers) over and over, so each
+    distinct pair is only calculated once. Like _income_tax_cached(), it
+    assumes the brackets and rates never change after import; changing them
+    requires reloading this module.
+    
+    Args:
+        gross_cents: Gross income in cents
+        exp_cents: Deductible expenses in cents
+    
+    Returns:
+        Tuple[Decimal, ...]: The _all_taxes_kernel() totals
+    """
+    return _all_taxes_kernel(_from_cents(gross_cents), _from_cents(exp_cents))
+
+
+def _is_whole_cents(amount: Decimal) -> bool:
+    """Check whether a finite amount has at most 2 decimal places."""
+    exponent = amount.as_tuple().exponent
+    return isinstance(exponent, int) and exponent >= -2
+
+
+def _all_taxes_totals(gross_income: Decimal, deductible_expenses: Decimal) -> Tuple[Decimal, ...]:
+    """
+    Return the _all_taxes_kernel() totals, memoized for whole-cent inputs.
+    
+    Inputs with sub-cent precision bypass the cache: VAT, EFKA and the
+    effective rate are calculated on the unrounded gross income, so keying
+    them on cents could change the result.
+    """
+    if _is_whole_cents(gross_income) and _is_whole_cents(deductible_expenses):
+        return _calc_all_taxes_cached(_to_cents(gross_income), _to_cents(deductible_expenses))
+    return _all_taxes_kernel(gross_income, deductible_expenses)
+
+
+def calculate_all_taxes_fast(gross_income: Union[Decimal, float, int, str],
+                             deductible_expenses: Union[Decimal, float, int, str]) -> TaxSummary:
+    """
+    Calculate the tax totals for a single taxpayer as a flat summary.
+    
+    Hot-path counterpart of calculate_all_taxes() for callers that only need
+    the totals. Income tax, VAT and EFKA are computed inline by the same row
+    kernel as calculate_all_taxes_batch(), so no nested result objects, bracket
+    breakdown or per-component log records are produced. The totals are
+    identical to those of calculate_all_taxes(), and are memoized per
+    (gross, expenses) pair for inputs given in whole cents.
+    
+    Args:
+        gross_income: Total gross income in EUR (excluding VAT)
+        deductible_expenses: Total deductible business expenses in EUR
+    
+    Returns:
+        TaxSummary: Flat tax totals, rounded to 2 decimal places
+    """
+    gross_income = Decimal(str(gross_income))
+    deductible_expenses = Decimal(str(deductible_expenses))
+    
+    return TaxSummary(
+        gross_income.quantize(_CENT, ROUND_HALF_UP),
+        deductible_expenses.quantize(_CENT, ROUND_HALF_UP),
+        *_all_taxes_totals(gross_income, deductible_expenses)
+    )
+
+
+def calculate_all_taxes_batch(gross_incomes: Sequence[Union[Decimal, float, int, str]],
+                              deductible_expenses: Sequence[Union[Decimal, float, int, str]]) -> TaxBatchResult:
+    """
+    Calculate all tax totals for many taxpayers in one call.
+    
+    Bulk counterpart of calculate_all_taxes(). Every taxpayer is independent,
+    so each row goes through a model-free kernel and the results are stored
+    column-wise in a TaxBatchResult. Income tax shares the per-cent cache of
+    calculate_income_tax(), so repeated salary levels are computed once.
+    
+    Args:
+        gross_incomes: Gross income in EUR (excluding VAT) for each taxpayer
+        deductible_expenses: Deductible expenses in EUR for each taxpayer,
+                             aligned with gross_incomes
+    
+    Returns:
+        TaxBatchResult: Column-wise tax totals, one entry per taxpayer
+    
+    Raises:
+        ValueError: If the two input sequences have different lengths
+    """
+    if len(gross_incomes) != len(deductible_expenses):
+        logger.error(f"Batch input length mismatch: {len(gross_incomes)} incomes, "
+                     f"{len(deductible_expenses)} expense values")
+        raise ValueError(
+            f"gross_incomes and deductible_expenses must have the same length "
+            f"(got {len(gross_incomes)} and {len(deductible_expenses)})"
+        )
+    
+    rows = [
+        _all_taxes_kernel(Decimal(str(gross)), Decimal(str(expenses)))
+        for gross, expenses in zip(gross_incomes, deductible_expenses)
+    ]
+    logger.debug(f"Batch tax calculation completed for {len(rows)} taxpayers")
+    
+    if not rows:
+        return TaxBatchResult()
+    return TaxBatchResult(*(list(column) for column in zip(*rows)))
+
+
 def calculate_payment_schedule(annual_tax: Union[Decimal, float, int, str], 
                               frequency: str = 'monthly') -> PaymentSchedule:
     """
@@ -413,38 +844,30 @@ def calculate_payment_schedule(annual_tax: Union[Decimal, float, int, str],
         logger.warning("Negative annual tax provided, using 0.00")
         annual_tax = Decimal('0.00')
     
-    if frequency.lower() not in VALID_FREQUENCIES:
+    # Frequencies are normally passed lowercase already; only normalize on a miss
+    normalized_frequency = frequency
+    num_payments = PAYMENTS_PER_YEAR.get(frequency)
+    if num_payments is None:
+        normalized_frequency = frequency.lower()
+        num_payments = PAYMENTS_PER_YEAR.get(normalized_frequency)
+    if num_payments is None:
         logger.error(f"Invalid payment frequency provided: '{frequency}'. Valid options: {VALID_FREQUENCIES}")
         raise ValueError(
             f"Invalid frequency '{frequency}'. Must be one of: {', '.join(VALID_FREQUENCIES)}"
         )
+    frequency = normalized_frequency
     
-    frequency = frequency.lower()
-    
-    payments_per_year = {
-        'monthly': 12,
-        'quarterly': 4,
-        'annual': 1
-    }
-    
-    num_payments = payments_per_year[frequency]
-    payment_amount = annual_tax / num_payments
-    
-    logger.debug(f"Payment schedule: {num_payments} installments of {payment_amount.quantize(Decimal('0.01'), ROUND_HALF_UP)} each")
+    payment_amount = (annual_tax / num_payments).quantize(_CENT, ROUND_HALF_UP)
     
-    schedule = []
-    for i in range(1, num_payments + 1):
-        schedule.append(PaymentInstallment(
-            period_number=i,
-            payment_amount=payment_amount.quantize(Decimal('0.01'), ROUND_HALF_UP)
-        ))
+    logger.debug(f"Payment schedule: {num_payments} installments of {payment_amount} each")
     
     return PaymentSchedule(
-        annual_total=annual_tax.quantize(Decimal('0.01'), ROUND_HALF_UP),
+        annual_total=annual_tax.quantize(_CENT, ROUND_HALF_UP),
         frequency=frequency,
         number_of_installments=num_payments,
-        installment_amount=payment_amount.quantize(Decimal('0.01'), ROUND_HALF_UP),
-        schedule=schedule
+        installment_amount=payment_amount,
+        period_numbers=tuple(range(1, num_payments + 1)),
+        payment_amounts=(payment_amount,) * num_payments
     )
 
 
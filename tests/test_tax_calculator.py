@@ -12,16 +12,23 @@ To run with coverage:
     pytest tests/test_tax_calculator.py --cov=tax_calculator --cov-report=term
 """
 
+import sys
 import pytest
 from decimal import Decimal
 from tax_calculator import (
     calculate_taxable_income,
     calculate_income_tax,
+    calculate_income_tax_batch,
     calculate_vat,
     calculate_social_security,
     calculate_all_taxes,
+    calculate_all_taxes_fast,
+    calculate_all_taxes_batch,
     calculate_payment_schedule,
     INCOME_TAX_BRACKETS,
+    TOP_RATE,
+    TOP_THRESHOLD,
+    PAYMENTS_PER_YEAR,
     VAT_RATE,
     EFKA_TOTAL_RATE,
     LAST_UPDATED,
@@ -49,12 +56,32 @@ class TestSmokeTests:
     def test_constants_exist(self):
         """Verify that required constants are defined."""
         assert INCOME_TAX_BRACKETS is not None
-        assert len(INCOME_TAX_BRACKETS) == 5
+        assert len(INCOME_TAX_BRACKETS) == 4
+        assert all(bracket.upper_limit.is_finite() for bracket in INCOME_TAX_BRACKETS)
+        assert TOP_THRESHOLD == Decimal('40000.00')
+        assert TOP_RATE == Decimal('0.44')
         assert VAT_RATE == Decimal('0.24')
         assert EFKA_TOTAL_RATE == Decimal('0.20')
         assert LAST_UPDATED is not None
         assert TAX_YEAR == 2024
     
+    def test_payments_per_year_is_read_only(self):
+        """Verify the frequency table has the expected values and cannot be modified."""
+        assert dict(PAYMENTS_PER_YEAR) == {'monthly': 12, 'quarterly': 4, 'annual': 1}
+        with pytest.raises(TypeError):
+            PAYMENTS_PER_YEAR['weekly'] = 52
+    
+    def test_tax_bracket_limit_validation(self):
+        """Verify bracket limits are converted to Decimal and must be finite and positive."""
+        from config import TaxBracket
+        
+        bracket = TaxBracket(upper_limit=10000, rate=Decimal('0.09'), description='test')
+        assert bracket.upper_limit == Decimal('10000')
+        assert isinstance(bracket.upper_limit, Decimal)
+        for invalid in ('inf', float('inf'), 0, -5, 'abc'):
+            with pytest.raises(ValueError):
+                TaxBracket(upper_limit=invalid, rate=Decimal('0.09'), description='test')
+    
     def test_basic_calculation_returns_dict(self):
         """Verify that calculate_all_taxes returns a dictionary with expected keys."""
         result = calculate_all_taxes(10000, 0)
@@ -343,6 +370,106 @@ class TestIncomeTax:
         """Test Example 4 from sample_calculations.txt: €3,000 taxable income."""
         result = calculate_income_tax(3000)
         assert result['total_tax'] == Decimal('270.00')
+    
+    def test_without_breakdown(self):
+        """Test that include_breakdown=False keeps totals but skips the breakdown."""
+        detailed = calculate_income_tax(50000)
+        result = calculate_income_tax(50000, include_breakdown=False)
+        
+        assert result.total_tax == detailed.total_tax == Decimal('13900.00')
+        assert result.effective_rate == detailed.effective_rate == Decimal('27.80')
+        assert result.bracket_breakdown == []
+        assert len(detailed.bracket_breakdown) == 5
+    
+    def test_repeated_income_uses_cache(self):
+        """Test that repeated incomes are served from the per-cent cache."""
+        from tax_calculator import _income_tax_cached
+        _income_tax_cached.cache_clear()
+        
+        first = calculate_income_tax(35000)
+        second = calculate_income_tax(Decimal('35000.00'))
+        
+        assert _income_tax_cached.cache_info().hits == 1
+        assert first == second
+        # Callers get their own breakdown list, not the cached tuple
+        assert first.bracket_breakdown is not second.bracket_breakdown
+        first.bracket_breakdown.clear()
+        assert len(calculate_income_tax(35000).bracket_breakdown) == 4
+    
+    def test_half_cent_tax_rounds_up(self):
+        """Test that tax landing exactly on half a cent is rounded half up."""
+        # 10000 * 0.09 + 0.25 * 0.22 = 900.055
+        result = calculate_income_tax(Decimal('10000.25'))
+        assert result.total_tax == Decimal('900.06')
+    
+    def test_sub_cent_input_rounded_to_cents(self):
+        """Test that taxable income is rounded to whole cents before taxing."""
+        assert calculate_income_tax('15000.004') == calculate_income_tax('15000.00')
+        assert calculate_income_tax('0.004').total_tax == Decimal('0.00')
+    
+    def test_breakdown_bracket_fields(self):
+        """Test the fixed bracket fields of every breakdown entry."""
+        result = calculate_income_tax(50000)
+        
+        assert [(b.bracket_min, b.bracket_max, b.rate) for b in result.bracket_breakdown] == [
+            (Decimal('0.00'), Decimal('10000.00'), Decimal('9.00')),
+            (Decimal('10000.00'), Decimal('20000.00'), Decimal('22.00')),
+            (Decimal('20000.00'), Decimal('30000.00'), Decimal('28.00')),
+            (Decimal('30000.00'), Decimal('40000.00'), Decimal('36.00')),
+            (Decimal('40000.00'), 'unlimited', Decimal('44.00')),
+        ]
+        assert result.bracket_breakdown[-1].taxable_amount == Decimal('10000.00')
+        assert result.bracket_breakdown[-1].tax_amount == Decimal('4400.00')
+
+
+@pytest.mark.unit
+class TestIncomeTaxBatch:
+    """Unit tests for calculate_income_tax_batch function."""
+    
+    def test_matches_scalar_calculation(self):
+        """Test that batch totals match calculate_income_tax for each income."""
+        incomes = [0, 3000, 10000, 10001, 15000, 25000, 30000, 40000, 50000, 100000]
+        results = calculate_income_tax_batch(incomes)
+        
+        assert len(results) == len(incomes)
+        for income, total_tax in zip(incomes, results):
+            assert total_tax == calculate_income_tax(income).total_tax
+    
+    def test_empty_input(self):
+        """Test that an empty batch returns an empty list."""
+        assert calculate_income_tax_batch([]) == []
+    
+    def test_batch_loop_matches_kernel(self):
+        """Test that the inlined batch loop agrees with the single-income kernel."""
+        from tax_calculator import _BRACKET_STARTS_CENTS, _income_tax_cents_batch, _income_tax_kernel
+        
+        edges = [start + offset for start in _BRACKET_STARTS_CENTS[1:] for offset in (-1, 0, 1)]
+        incomes = [1, 5, 6, 99, *edges, 10**12]
+        
+        assert _income_tax_cents_batch(incomes) == [_income_tax_kernel(cents)[0] for cents in incomes]
+        assert _income_tax_cents_batch([0, -1]) == [0, 0]
+    
+    def test_bracket_limits_and_rounding(self):
+        """Test incomes on and one cent past each bracket limit, and half-cent taxes."""
+        incomes = ['9999.99', '10000.00', '10000.01', '40000.00', '40000.01', '0.01', '0.05', '0.06']
+        results = calculate_income_tax_batch(incomes)
+        
+        assert results == [calculate_income_tax(income).total_tax for income in incomes]
+    
+    def test_negative_income_returns_zero(self):
+        """Test that negative incomes are taxed at zero."""
+        assert calculate_income_tax_batch([-1000]) == [Decimal('0.00')]
+    
+    def test_mixed_input_types(self):
+        """Test that int, float, str and Decimal inputs are all accepted."""
+        results = calculate_income_tax_batch([15000, 15000.0, '15000', Decimal('15000')])
+        assert results == [Decimal('2000.00')] * 4
+        assert all(isinstance(r, Decimal) for r in results)
+    
+    def test_accepts_generator(self):
+        """Test that any iterable can be passed, not just lists."""
+        results = calculate_income_tax_batch(income for income in (10000, 20000))
+        assert results == [Decimal('900.00'), Decimal('3100.00')]
 
 
 @pytest.mark.unit
@@ -466,6 +593,17 @@ class TestSocialSecurity:
         # Allow for minor rounding differences
         assert abs(result['total_contribution'] - total) <= Decimal('0.01')
     
+    def test_total_rounds_full_rate_amount(self):
+        """Test that the total is 20% of gross rounded once, not the sum of rounded parts."""
+        # The rounded parts (24209.02 + 12113.59) sum to 36322.61, but the
+        # total is 20% of gross rounded once: 36322.604 -> 36322.60
+        gross = Decimal('181613.02')
+        result = calculate_social_security(gross)
+        
+        assert result.total_contribution == Decimal('36322.60')
+        assert calculate_all_taxes(gross, 0).social_security == result
+        assert calculate_all_taxes_fast(gross, 0).social_security == Decimal('36322.60')
+    
     def test_zero_income(self):
         """Test EFKA calculation for zero income."""
         result = calculate_social_security(0)
@@ -770,6 +908,141 @@ class TestAllTaxes:
             value = str(result[key])
             if '.' in value:
                 assert len(value.split('.')[-1]) <= 2, f"{key} has more than 2 decimal places"
+    
+    def test_zero_expenses_taxable_equals_gross(self):
+        """Test the no-expenses path: taxable income is the rounded gross income."""
+        result = calculate_all_taxes(Decimal('15000.005'), 0)
+        
+        assert result.taxable_income == result.gross_income == Decimal('15000.01')
+        assert result.income_tax.total_tax == calculate_income_tax(Decimal('15000.01')).total_tax
+        assert result.vat.vat_amount == Decimal('3600.00')
+    
+    def test_zero_income_result_reflects_inputs(self):
+        """Test that the shared zero-income parts keep per-call inputs and lists separate."""
+        first = calculate_all_taxes(-1000.005, 250)
+        second = calculate_all_taxes(0, 0)
+        
+        assert first.gross_income == Decimal('-1000.01')
+        assert first.deductible_expenses == Decimal('250.00')
+        assert first.total_taxes == first.net_income == Decimal('0.00')
+        assert first.vat == second.vat == calculate_vat(0)
+        assert first.social_security == calculate_social_security(0)
+        assert first.income_tax.bracket_breakdown is not second.income_tax.bracket_breakdown
+    
+    def test_single_income_tax_calculation_per_call(self):
+        """Test that a detailed calculation computes income tax only once."""
+        from tax_calculator import _income_tax_cached
+        
+        _income_tax_cached.cache_clear()
+        calculate_all_taxes(Decimal('71234.56'), Decimal('1000.00'))
+        
+        assert _income_tax_cached.cache_info().misses == 1
+        assert _income_tax_cached.cache_info().currsize == 1
+    
+    def test_without_detail_skips_breakdown(self):
+        """Test that detailed=False keeps all totals but omits the bracket breakdown."""
+        detailed = calculate_all_taxes(60000, 10000)
+        result = calculate_all_taxes(60000, 10000, detailed=False)
+        
+        assert result.income_tax.bracket_breakdown == []
+        assert len(detailed.income_tax.bracket_breakdown) == 5
+        assert result.income_tax.total_tax == detailed.income_tax.total_tax
+        assert result.total_taxes == detailed.total_taxes
+        assert result.net_income == detailed.net_income
+        assert result.effective_total_rate == detailed.effective_total_rate
+
+
+@pytest.mark.unit
+class TestAllTaxesFast:
+    """Unit tests for calculate_all_taxes_fast function."""
+    
+    def test_matches_full_calculation(self):
+        """Test that the flat summary matches calculate_all_taxes."""
+        for income, expense in [(15000, 0), (35000, 5000), (60000, 10000),
+                                (10000, 15000), (45000.50, 7000.25), (0, 0), (-1000, 500)]:
+            summary = calculate_all_taxes_fast(income, expense)
+            result = calculate_all_taxes(income, expense)
+            
+            assert summary.gross_income == result.gross_income
+            assert summary.deductible_expenses == result.deductible_expenses
+            assert summary.taxable_income == result.taxable_income
+            assert summary.income_tax == result.income_tax.total_tax
+            assert summary.social_security == result.social_security.total_contribution
+            assert summary.vat == result.vat.vat_amount
+            assert summary.total_taxes == result.total_taxes
+            assert summary.total_obligations == result.total_obligations
+            assert summary.net_income == result.net_income
+            assert summary.effective_total_rate == result.effective_total_rate
+    
+    def test_repeated_inputs_use_cache(self):
+        """Test that repeated whole-cent inputs return the memoized totals."""
+        from tax_calculator import _calc_all_taxes_cached
+        
+        first = calculate_all_taxes_fast(Decimal('27500.00'), Decimal('1234.56'))
+        hits_before = _calc_all_taxes_cached.cache_info().hits
+        second = calculate_all_taxes_fast(27500, '1234.56')
+        
+        assert _calc_all_taxes_cached.cache_info().hits == hits_before + 1
+        assert second == first
+    
+    def test_sub_cent_inputs_bypass_cache(self):
+        """Test that sub-cent inputs are calculated on the unrounded gross income."""
+        # 0.024 * 24% = 0.00576 -> 0.01 VAT; rounding the input to 0.02 first would give 0.00
+        summary = calculate_all_taxes_fast(Decimal('0.024'), 0)
+        
+        assert summary.gross_income == Decimal('0.02')
+        assert summary.vat == Decimal('0.01')
+    
+    def test_known_values(self):
+        """Test Example 2 from sample_calculations.txt."""
+        summary = calculate_all_taxes_fast(35000, 5000)
+        
+        assert summary.taxable_income == Decimal('30000.00')
+        assert summary.total_taxes == Decimal('12900.00')
+        assert summary.net_income == Decimal('22100.00')
+
+
+@pytest.mark.unit
+class TestAllTaxesBatch:
+    """Unit tests for calculate_all_taxes_batch function."""
+    
+    def test_matches_scalar_calculation(self):
+        """Test that every batch row matches calculate_all_taxes."""
+        incomes = [15000, 35000, 60000, 12000, 0, -1000, 10000, 45000.50]
+        expenses = [0, 5000, 10000, 9000, 0, 0, 15000, 7000.25]
+        batch = calculate_all_taxes_batch(incomes, expenses)
+        
+        assert len(batch) == len(incomes)
+        for i, (income, expense) in enumerate(zip(incomes, expenses)):
+            result = calculate_all_taxes(income, expense)
+            assert batch.taxable_income[i] == result.taxable_income
+            assert batch.income_tax[i] == result.income_tax.total_tax
+            assert batch.social_security[i] == result.social_security.total_contribution
+            assert batch.vat[i] == result.vat.vat_amount
+            assert batch.total_taxes[i] == result.total_taxes
+            assert batch.total_obligations[i] == result.total_obligations
+            assert batch.net_income[i] == result.net_income
+            assert batch.effective_total_rate[i] == result.effective_total_rate
+    
+    def test_column_totals(self):
+        """Test that columns can be aggregated directly."""
+        batch = calculate_all_taxes_batch([15000, 35000], [0, 5000])
+        
+        # Example 1 (€5,000) + Example 2 (€12,900) from sample_calculations.txt
+        assert sum(batch.total_taxes) == Decimal('17900.00')
+    
+    def test_empty_batch(self):
+        """Test that empty inputs produce an empty result."""
+        batch = calculate_all_taxes_batch([], [])
+        assert len(batch) == 0
+        assert batch.total_taxes == []
+    
+    def test_length_mismatch_raises_error(self):
+        """Test that misaligned inputs raise ValueError."""
+        with pytest.raises(ValueError) as exc_info:
+            calculate_all_taxes_batch([15000, 35000], [0])
+        
+        assert 'same length' in str(exc_info.value)
 
 
 @pytest.mark.unit
@@ -968,3 +1241,117 @@ class TestPaymentSchedule:
         
         assert result['payment_amount'] == Decimal('8333.33')
         assert result['annual_total'] == Decimal('100000.00')
+    
+    def test_parallel_installment_tuples(self):
+        """Test that installments are exposed as aligned period/amount tuples."""
+        result = calculate_payment_schedule(2670, 'quarterly')
+        
+        assert result.period_numbers == (1, 2, 3, 4)
+        assert result.payment_amounts == (Decimal('667.50'),) * 4
+        assert sum(result.payment_amounts) == Decimal('2670.00')
+    
+    def test_schedule_property_matches_tuples(self):
+        """Test that the schedule property materializes one installment per period."""
+        result = calculate_payment_schedule(12000, 'monthly')
+        schedule = result.schedule
+        
+        assert len(schedule) == 12
+        assert [p.period_number for p in schedule] == list(result.period_numbers)
+        assert [p.payment_amount for p in schedule] == list(result.payment_amounts)
+    
+    def test_mixed_case_frequency_normalized(self):
+        """Test that non-lowercase frequencies are normalized in the result."""
+        for frequency in ('monthly', 'Quarterly', 'ANNUAL'):
+            result = calculate_payment_schedule(12000, frequency)
+            assert result.frequency == frequency.lower()
+            assert result.number_of_installments == PAYMENTS_PER_YEAR[frequency.lower()]
+    
+    def test_invalid_frequency_message_keeps_input(self):
+        """Test that the error message shows the frequency as passed in."""
+        with pytest.raises(ValueError) as exc_info:
+            calculate_payment_schedule(12000, 'Weekly')
+        
+        assert "'Weekly'" in str(exc_info.value)
+
+
+@pytest.mark.unit
+class TestResultModels:
+    """Unit tests for the shared behaviour of the result dataclasses."""
+    
+    def test_legacy_item_access(self):
+        """Test that results still support read-only dict-style access."""
+        result = calculate_all_taxes(50000, 10000)
+        
+        assert result['total_taxes'] == result.total_taxes
+        assert result['income_tax']['total_tax'] == result.income_tax.total_tax
+        assert result['income_tax']['bracket_breakdown'][0]['rate'] == Decimal('9.00')
+        assert 'net_income' in result
+        assert 'missing' not in result
+    
+    def test_legacy_item_access_rejects_unknown_keys(self):
+        """Test that only field names and legacy aliases are exposed."""
+        result = calculate_vat(10000)
+        
+        with pytest.raises(KeyError):
+            result['missing']
+        with pytest.raises(KeyError):
+            result['to_dict']
+    
+    def test_payment_schedule_legacy_keys(self):
+        """Test the old payment schedule dictionary key names."""
+        result = calculate_payment_schedule(12000, 'monthly')
+        
+        assert result['number_of_payments'] == 12
+        assert result['payment_amount'] == Decimal('1000.00')
+        assert result['schedule'][0]['period_number'] == 1
+    
+    def test_legacy_keys_iteration(self):
+        """Test that results iterate over their keys like the old dictionaries."""
+        result = calculate_social_security(10000)
+        
+        assert list(result) == ['total_contribution', 'main_insurance', 'additional_contributions', 'rate']
+        assert result.keys() == list(result)
+        assert dict(result)['rate'] == Decimal('20.00')
+        assert result.get('main_insurance') == Decimal('1333.00')
+        assert result.get('missing', 'default') == 'default'
+    
+    def test_legacy_keys_include_properties_but_not_class_constants(self):
+        """Test that properties are keys while internal class attributes are not."""
+        result = calculate_payment_schedule(12000, 'monthly')
+        
+        assert 'schedule' in result
+        assert list(result)[-1] == 'schedule'
+        assert '_LEGACY_KEYS' not in result
+        with pytest.raises(KeyError):
+            result['_LEGACY_KEYS']
+    
+    def test_legacy_keys_computed_once_per_class(self):
+        """Test that the key set is cached per class rather than rebuilt on each lookup."""
+        from models import _ITEM_KEYS
+        
+        result = calculate_vat(10000)
+        result['vat_amount']
+        cached = _ITEM_KEYS[type(result)]
+        calculate_vat(20000)['rate']
+        
+        assert _ITEM_KEYS[type(result)] is cached
+        assert cached[1] == frozenset(['vat_amount', 'rate'])
+    
+    def test_new_models_are_attribute_only(self):
+        """Test that models that never were dictionaries have no dict-style access."""
+        for obj in (calculate_all_taxes_fast(50000, 10000), calculate_all_taxes_batch([50000], [10000])):
+            with pytest.raises(TypeError):
+                obj['total_taxes']
+        with pytest.raises(TypeError):
+            iter(calculate_all_taxes_fast(50000, 10000))
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10+")
+    def test_results_are_slotted(self):
+        """Test that result objects carry no per-instance __dict__."""
+        result = calculate_all_taxes(50000, 10000)
+        
+        for obj in (result, result.income_tax, result.income_tax.bracket_breakdown[0],
+                    result.vat, result.social_security, calculate_all_taxes_fast(50000, 10000),
+                    calculate_payment_schedule(12000)):
+            assert not hasattr(obj, '__dict__')
+